@@ -0,0 +1,125 @@
+import os
+import struct
+import numpy as np
+
+SAMPLE_RATE = 16000  # Sample rate expected by Whisper and pyannote
+
+# WAV sample formats that can be memory-mapped directly: (format tag, bits per sample) -> (dtype, offset, scale);
+# 24-bit samples have no numpy dtype, so they are mapped as raw bytes and widened to int32 block by block
+SAMPLE_FORMATS = {
+    (1, 8): ('u1', 128.0, 1 / 128.0),
+    (1, 16): ('<i2', 0.0, 1 / 32768.0),
+    (1, 24): ('u1', 0.0, 1 / 8388608.0),
+    (1, 32): ('<i4', 0.0, 1 / 2147483648.0),
+    (3, 32): ('<f4', 0.0, 1.0),
+}
+
+# Function to read the format and the location of the sample data from a RIFF/WAVE header
+def read_wav_header(wav_path):
+    with open(wav_path, 'rb') as f:
+        riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+        if riff != b'RIFF' or wave_id != b'WAVE':
+            raise ValueError(f"Not a WAV file: {wav_path}")
+
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"No data chunk found in WAV file: {wav_path}")
+            chunk_id, chunk_size = struct.unpack('<4sI', header)
+            if chunk_id == b'fmt ':
+                body = f.read(chunk_size)
+                format_tag, channels, rate, _, block_align, bits = struct.unpack('<HHIIHH', body[:16])
+                # WAVE_FORMAT_EXTENSIBLE stores the real format tag at the start of the sub-format GUID
+                if format_tag == 0xFFFE:
+                    format_tag = struct.unpack('<H', body[24:26])[0]
+                fmt = (format_tag, channels, rate, block_align, bits)
+            elif chunk_id == b'data':
+                if fmt is None:
+                    raise ValueError(f"WAV data chunk precedes its format chunk: {wav_path}")
+                return fmt, f.tell(), chunk_size
+            else:
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+# Function to memory-map the raw sample frames of a WAV file as a (frames, channels) array
+def map_wav(wav_path):
+    (format_tag, channels, rate, block_align, bits), offset, size = read_wav_header(wav_path)
+    if (format_tag, bits) not in SAMPLE_FORMATS:
+        raise ValueError(f"Unsupported WAV sample format (tag {format_tag}, {bits}-bit): {wav_path}")
+    dtype, zero, scale = SAMPLE_FORMATS[(format_tag, bits)]
+    # Streamed recordings may leave the data size unset, so never map past the end of the file
+    size = min(size, os.path.getsize(wav_path) - offset)
+    shape = (size // block_align, channels, 3) if bits == 24 else (size // block_align, channels)
+    frames = np.memmap(wav_path, dtype=dtype, mode='r', offset=offset, shape=shape)
+    return frames, rate, zero, scale
+
+# Function to read frames [start, stop) as a (frames, channels) float32 array of raw sample values
+def read_frames(frames, start, stop):
+    block = frames[start:stop]
+    if block.ndim == 3:
+        # Assemble little-endian 24-bit samples in the top bytes of an int32 and shift back down to sign-extend
+        block = block.astype(np.int32)
+        block = ((block[..., 0] << 8) | (block[..., 1] << 16) | (block[..., 2] << 24)) >> 8
+    return block.astype(np.float32)
+
+# Function to build a windowed-sinc low-pass filter that removes content above the new Nyquist frequency
+def lowpass_kernel(ratio, taps=63):
+    cutoff = 0.5 / ratio
+    n = np.arange(taps) - (taps - 1) / 2
+    kernel = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(taps)
+    return (kernel / kernel.sum()).astype(np.float32)
+
+# Function to resample one block of output samples, reading only the input frames it needs
+def resample_block(frames, zero, scale, positions, kernel):
+    half = len(kernel) // 2 if kernel is not None else 0
+    first = int(positions[0]) - half
+    last = int(positions[-1]) + 2 + half
+
+    # Downmix to mono float32, zero-padding past either end of the recording
+    block = read_frames(frames, max(first, 0), min(last, len(frames)))
+    block = (block.mean(axis=1) - zero) * scale
+    block = np.pad(block, (max(0, -first), max(0, last - len(frames))))
+
+    if kernel is not None:
+        block = np.convolve(block, kernel, mode='same')
+
+    # Linear interpolation at the output sample positions
+    local = positions - first
+    base = local.astype(np.int64)
+    frac = (local - base).astype(np.float32)
+    return block[base] * (1 - frac) + block[base + 1] * frac
+
+# Function to resample a WAV file to 16 kHz mono float32 chunk by chunk into a memory-mapped cache file
+def load_audio_16k(wav_path, cache_path=None, chunk_seconds=60):
+    cache_path = cache_path or os.path.splitext(wav_path)[0] + '.16k.f32'
+
+    frames, rate, zero, scale = map_wav(wav_path)
+    ratio = rate / SAMPLE_RATE
+    n_out = int(len(frames) / ratio)
+    if n_out == 0:
+        raise ValueError(f"WAV file contains no audio: {wav_path}")
+
+    # Reuse the cache if it is newer than the source recording and holds every resampled sample
+    if (os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(wav_path)
+            and os.path.getsize(cache_path) == n_out * np.dtype(np.float32).itemsize):
+        return np.memmap(cache_path, dtype=np.float32, mode='c')
+
+    # Resample into a private temporary file and move it into place only once it is complete, so an interrupted
+    # run never leaves a partial cache behind and a concurrent run never truncates a cache another process has mapped
+    kernel = lowpass_kernel(ratio) if ratio > 1 else None
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        audio = np.memmap(temp_path, dtype=np.float32, mode='w+', shape=(n_out,))
+        chunk = chunk_seconds * SAMPLE_RATE
+        for start in range(0, n_out, chunk):
+            positions = np.arange(start, min(start + chunk, n_out)) * ratio
+            audio[start:start + len(positions)] = resample_block(frames, zero, scale, positions, kernel)
+        audio.flush()
+        del audio
+        os.replace(temp_path, cache_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    # Map the finished cache copy-on-write so every stage can share its pages
+    return np.memmap(cache_path, dtype=np.float32, mode='c')
@@ -1,77 +1,133 @@
-import whisper
+import csv
+import os
 import torch
-from pyannote.audio import Pipeline
-from pydub import AudioSegment
 import pandas as pd
-
-# Load Hugging Face token from file
-with open('hugging face token.txt', 'r') as f:
-    hf_token = f.read().strip()
-
-# Initialize Whisper model (base model)
-model = whisper.load_model("base")
+from audio_loader import SAMPLE_RATE, load_audio_16k
+from diarization import get_turns, coalesce_turns, diarize_chunked
+from model_registry import get_diarization_pipeline, get_whisper
+from staged_pipeline import print_stats, run_stages
+from transcripts import Segment, format_segment
+from transcription_engine import (
+    detect_language, transcribe_aligned, transcribe_batched, transcribe_parallel, transcribe_sequential,
+    transcribe_stream, vote_language
+)
 
 # Set path to your WAV audio file
 audio_wav_path = "./processed_audio/processed_audio.wav"
 
-# Load the WAV audio file using pydub
-audio = AudioSegment.from_wav(audio_wav_path)
-
-# Initialize Pyannote Speaker Diarization pipeline
-pipeline = Pipeline.from_pretrained('pyannote/speaker-diarization-3.1', use_auth_token=hf_token)
-
-# Apply speaker diarization using the Pyannote pipeline
-diarization = pipeline({"uri": "audio", "audio": audio_wav_path})
-
-# Create a list to store speaker-wise transcriptions
-transcriptions = []
-
-# Open a file to write the transcriptions
-with open('transcription.txt', 'w') as file:
-    
-    # Process each speech segment for each speaker identified by the diarization pipeline
-    for turn, _, speaker in diarization.itertracks(yield_label=True):
-        start_time = turn.start
-        end_time = turn.end
-        duration = end_time - start_time
-
-        # Extract the specific speaker's segment from the audio
-        speaker_audio = audio[start_time * 1000:end_time * 1000]  # Convert seconds to milliseconds
-        speaker_audio.export('temp.wav', format='wav')  # Save speaker's segment to temporary WAV file
-
-        # Transcribe the speaker's segment using Whisper
-        result = model.transcribe('temp.wav')
-
-        # Append the transcription along with the speaker label, start time, end time, and text
-        transcriptions.append({
-            'speaker': speaker,
-            'start_time': start_time,
-            'end_time': end_time,
-            'duration': duration,
-            'text': result['text']
-        })
-
-        # Write the speaker's transcription to the file
-        file.write(f"Speaker {speaker} ({start_time:.2f}s - {end_time:.2f}s): {result['text']}\n")
-
-# Detect language of the full audio using Whisper
-language_result = model.transcribe(audio_wav_path, task="detect-language")
-language = language_result['language']
-
-# Write the detected language to a separate file
-with open('detected_language.txt', 'w') as lang_file:
-    lang_file.write(f"Detected Language: {language}\n")
-
-# Create a pandas DataFrame from the transcriptions
-df = pd.DataFrame([{
-    'speaker': t['speaker'],
-    'duration': t['duration'],
-    'document': t['text']
-} for t in transcriptions])
-
-# Save the DataFrame to a CSV file
-df.to_csv('sample.csv')
-
-# Display the pandas DataFrame
-print("\nPandas DataFrame Output:")
-print(df)
+# Whisper checkpoint used by the main process and by every transcription worker
+whisper_model_name = "base"
+
+# Transcription settings: "batched" decodes turns in batches of 30 s windows, "aligned" transcribes the
+# whole file once and assigns its words to turns, "sequential" runs one Whisper call per turn
+transcription_mode = "batched"
+batch_size = 8
+
+# Pipelined execution for batched mode: diarization, transcription and the output writers run as
+# concurrent stages connected by queues of at most queue_size items
+pipelined = True
+queue_size = 16
+
+# Worker pool settings for batched mode: n_workers > 1 fans turns out over processes, each limited
+# to torch_threads intra-op threads so the workers don't oversubscribe the CPU
+n_workers = 1
+torch_threads = max(1, (os.cpu_count() or 1) // n_workers)
+
+# Windowed diarization settings: set diarization_chunk_seconds to diarize long recordings in overlapping
+# windows whose speaker labels are stitched by embedding similarity; None diarizes the whole file at once
+diarization_chunk_seconds = None
+diarization_overlap_seconds = 30
+speaker_similarity_threshold = 0.6
+
+# Turn coalescing settings: merge same-speaker turns closer than merge_gap_ms, then
+# "absorb" (into the neighbouring turn) or "drop" turns shorter than min_turn_ms
+merge_gap_ms = 500
+min_turn_ms = 300
+short_turns = "absorb"
+
+# Function to diarize the audio buffer, yielding (start_time, end_time, speaker) turns
+def diarize(pipeline, audio):
+    if diarization_chunk_seconds:
+        yield from diarize_chunked(pipeline, audio, SAMPLE_RATE, diarization_chunk_seconds,
+                                   diarization_overlap_seconds, speaker_similarity_threshold)
+    else:
+        diarization = pipeline({"uri": "audio", "waveform": torch.from_numpy(audio)[None], "sample_rate": SAMPLE_RATE})
+        yield from get_turns(diarization)
+
+# Function to write each finished record to transcription.txt and sample.csv as it arrives
+def write_records(records):
+    with open('transcription.txt', 'w', encoding='utf-8') as file, \
+            open('sample.csv', 'w', encoding='utf-8', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['', 'speaker', 'duration', 'document'])
+        for index, t in enumerate(records):
+            # Write the speaker's transcription to the files
+            file.write(format_segment(Segment(t['speaker'], t['start_time'], t['end_time'], t['text'])) + "\n")
+            writer.writerow([index, t['speaker'], t['duration'], t['text']])
+            file.flush()
+            csv_file.flush()
+            yield t
+
+def main(audio_wav_path=audio_wav_path):
+    # Get the Whisper model from the shared registry
+    torch.set_num_threads(torch_threads)
+    model = get_whisper(whisper_model_name)
+
+    # Resample the WAV audio file chunk by chunk into a memory-mapped float32 16 kHz mono buffer
+    audio = load_audio_16k(audio_wav_path)
+
+    # Get the Pyannote Speaker Diarization pipeline from the shared registry
+    pipeline = get_diarization_pipeline('pyannote/speaker-diarization-3.1')
+
+    coalesce_stats = {}
+    if transcription_mode == "batched" and pipelined and n_workers == 1:
+        # Stream coalesced turns into transcription and finished records into the writers as soon as they are ready
+        transcriptions, stats = run_stages(
+            lambda: coalesce_turns(diarize(pipeline, audio), merge_gap_ms, min_turn_ms, short_turns, coalesce_stats),
+            [('transcription', lambda turns: transcribe_stream(model, audio, turns, batch_size)),
+             ('writer', write_records)],
+            queue_size=queue_size
+        )
+        print_stats(stats)
+    else:
+        # Apply speaker diarization using the Pyannote pipeline on a view of the same mapped buffer, then
+        # coalesce micro-turns so each Whisper call covers a meaningful stretch of speech
+        turns = list(coalesce_turns(diarize(pipeline, audio), merge_gap_ms, min_turn_ms, short_turns, coalesce_stats))
+
+        # Transcribe the speaker turns, keeping them in diarization order
+        if transcription_mode == "batched" and n_workers > 1:
+            transcriptions = transcribe_parallel(audio, turns, n_workers, torch_threads, whisper_model_name, batch_size)
+        elif transcription_mode == "batched":
+            transcriptions = transcribe_batched(model, audio, turns, batch_size=batch_size)
+        elif transcription_mode == "aligned":
+            transcriptions = transcribe_aligned(model, audio, turns)
+        else:
+            transcriptions = transcribe_sequential(model, audio, turns)
+
+        transcriptions = list(write_records(transcriptions))
+
+    print(f"Coalesced {coalesce_stats['turns_in']} turns into {coalesce_stats['turns_out']}: "
+          f"{coalesce_stats['turns_in'] - coalesce_stats['turns_out']} model calls saved")
+
+    # Detect language from the segments already decoded, falling back to the first 30 s of audio
+    language = vote_language(transcriptions) or detect_language(model, audio)
+
+    # Write the detected language to a separate file
+    with open('detected_language.txt', 'w') as lang_file:
+        lang_file.write(f"Detected Language: {language}\n")
+
+    # Create a pandas DataFrame from the transcriptions
+    df = pd.DataFrame([{
+        'speaker': t['speaker'],
+        'duration': t['duration'],
+        'document': t['text']
+    } for t in transcriptions])
+
+    # Display the pandas DataFrame
+    print("\nPandas DataFrame Output:")
+    print(df)
+    return transcriptions
+
+# Guard the entry point so transcription worker processes can import this module safely
+if __name__ == "__main__":
+    main()
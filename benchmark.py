@@ -0,0 +1,211 @@
+import argparse
+import os
+import time
+
+# Function to time how transcription wall time scales from 1 to N worker processes
+def benchmark_transcription(args):
+    from audio_loader import load_audio_16k
+    from transcription_engine import SAMPLE_RATE, transcribe_parallel
+
+    audio = load_audio_16k(args.audio)
+
+    # Uniform synthetic turns isolate transcription scaling from diarization, repeated to give the pool enough work
+    length = len(audio) / SAMPLE_RATE
+    turns = [(start, min(start + args.turn_seconds, length), "SPEAKER_00")
+             for start in _frange(0, length, args.turn_seconds)] * args.repeat
+    print(f"{len(turns)} turns of up to {args.turn_seconds:.1f}s from {args.audio} ({length:.1f}s of audio)")
+
+    baseline = None
+    for n_workers in range(1, args.max_workers + 1):
+        torch_threads = max(1, (os.cpu_count() or 1) // n_workers)
+        start = time.perf_counter()
+        transcribe_parallel(audio, turns, n_workers, torch_threads, args.model, args.batch_size)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={n_workers} threads/worker={torch_threads} wall={elapsed:.2f}s speedup={baseline / elapsed:.2f}x")
+
+# Function to compare cold-start and warm-start latency of the shared model registry
+def benchmark_registry(args):
+    import model_registry
+
+    getters = {'whisper': model_registry.get_whisper, 'diarization': model_registry.get_diarization_pipeline,
+               'summarizer': model_registry.get_summarizer, 'sentiment': model_registry.get_sequence_classifier}
+    for name in args.models:
+        start = time.perf_counter()
+        getters[name]()
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        getters[name]()
+        warm = time.perf_counter() - start
+        print(f"{name}: cold={cold:.2f}s warm={warm * 1000:.3f}ms")
+
+    # Time the same job twice against a running model server: the first call may load models, the second reuses them
+    if args.server_job:
+        # The sentiment job takes a list of texts, the other jobs take positional arguments
+        job_args = [args.server_args] if args.server_job == 'sentiment' else args.server_args
+        for attempt in ("first", "second"):
+            start = time.perf_counter()
+            model_registry.submit(args.server_job, *job_args, address=args.address)
+            print(f"server {args.server_job} ({attempt} call): {time.perf_counter() - start:.2f}s")
+
+# Function run in a fresh process to score texts on one sentiment backend and measure its peak memory
+def _score_backend(backend, texts):
+    import resource
+    from sentiment_analysis import SentimentScorer
+
+    scorer = SentimentScorer(backend=backend)
+    start = time.perf_counter()
+    labels = scorer.score(texts)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return labels, scorer.startup_seconds, elapsed, peak_mb
+
+# Function to check the accuracy parity of the int8/ONNX sentiment backends against fp32 and compare their speed
+def benchmark_sentiment_backends(args):
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    import pandas as pd
+    from sentiment_analysis import SENTIMENT_CHECKPOINT, export_onnx, onnx_path_for
+
+    texts = pd.read_csv(args.csv)['document'].fillna('').astype(str).tolist() * args.repeat
+
+    # Export the ONNX model up front so the export is not counted against the ONNX backend
+    if 'onnx' in args.backends and not os.path.exists(onnx_path_for(SENTIMENT_CHECKPOINT)):
+        export_onnx(SENTIMENT_CHECKPOINT, onnx_path_for(SENTIMENT_CHECKPOINT))
+
+    results = {}
+    for backend in ['fp32'] + [b for b in args.backends if b != 'fp32']:
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results[backend] = pool.submit(_score_backend, backend, texts).result()
+
+    reference = results['fp32'][0]
+    for backend, (labels, startup, elapsed, peak_mb) in results.items():
+        agreement = sum(a == b for a, b in zip(labels, reference)) / len(reference)
+        print(f"{backend}: startup={startup:.2f}s rows/s={len(texts) / elapsed:.1f} peak_rss={peak_mb:.0f}MB "
+              f"agreement_with_fp32={agreement:.1%}")
+
+# Function to measure latency and tokens/s of each summarization profile on one transcript
+def benchmark_summarizer(args):
+    from text_summarizer import summarize
+    from transcripts import read_transcript
+
+    text = " ".join(segment.text for segment in read_transcript(args.transcript))
+    for profile in args.profiles:
+        # Load the profile's checkpoint before timing so only generation is measured
+        summarize("warm up.", profile)
+        start = time.perf_counter()
+        summary = summarize(text, profile)
+        print(f"{profile}: latency={time.perf_counter() - start:.2f}s summary_words={len(summary.split())}")
+
+# Function to measure how many transcript files per minute a stage processes over a directory in one invocation
+def benchmark_transcripts(args):
+    import tempfile
+    from transcripts import find_transcripts
+
+    paths = list(find_transcripts(args.paths))
+    with tempfile.TemporaryDirectory() as output_dir:
+        if args.stage == "summarizer":
+            from text_summarizer import summarize_files
+            run = lambda: summarize_files(paths, output_dir, args.profile, cache_path=None)
+        else:
+            from topic_modelling import model_files
+            run = lambda: model_files(paths, output_dir)
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+    print(f"{args.stage}: {len(paths)} files in {elapsed:.1f}s, {len(paths) / elapsed * 60:.1f} files/min")
+
+# Function to measure how fast the shared transcript parser streams segments from a large synthetic corpus
+def benchmark_parser(args):
+    import tempfile
+    from transcripts import read_transcript
+
+    with open(args.transcript, 'r', encoding='utf-8') as f:
+        sample = f.read()
+    if not sample.endswith("\n"):
+        sample += "\n"
+
+    # Repeat the sample transcript until the corpus reaches the requested size
+    repeats = max(1, int(args.size_mb * 1024 * 1024 / len(sample.encode('utf-8'))))
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False) as corpus:
+        for _ in range(repeats):
+            corpus.write(sample)
+    try:
+        size_mb = os.path.getsize(corpus.name) / (1024 * 1024)
+        start = time.perf_counter()
+        segments = sum(1 for _ in read_transcript(corpus.name))
+        elapsed = time.perf_counter() - start
+    finally:
+        os.remove(corpus.name)
+    print(f"Parsed {segments} segments from {size_mb:.0f} MB in {elapsed:.2f}s ({size_mb / elapsed:.0f} MB/s)")
+
+# Function to compare NLTK startup time: per-run nltk.download calls vs the local resource check
+def benchmark_nltk_startup(args):
+    import nltk
+    import nltk_resources
+
+    names = ['punkt', 'stopwords', 'wordnet']
+    start = time.perf_counter()
+    for name in names:
+        nltk.download(nltk_resources.RESOURCES[name].split('/')[-1], quiet=True)
+    download_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    nltk_resources.ensure_nltk_resources(*names)
+    ensure_seconds = time.perf_counter() - start
+    print(f"nltk.download on every run: {download_seconds:.2f}s, local resource check: {ensure_seconds * 1000:.1f}ms")
+
+# Function to step through a float range
+def _frange(start, stop, step):
+    while start < stop:
+        yield start
+        start += step
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DiscernAI pipeline benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    transcription = subparsers.add_parser("transcription", help="Transcription wall time for 1..N worker processes")
+    transcription.add_argument("--audio", default="audio.wav")
+    transcription.add_argument("--model", default="base")
+    transcription.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    transcription.add_argument("--batch-size", type=int, default=8)
+    transcription.add_argument("--turn-seconds", type=float, default=2.0)
+    transcription.add_argument("--repeat", type=int, default=10)
+    transcription.set_defaults(run=benchmark_transcription)
+
+    registry = subparsers.add_parser("registry", help="Cold vs warm model load latency, in process and via the model server")
+    registry.add_argument("--models", nargs="*", default=['whisper', 'summarizer', 'sentiment'],
+                          choices=['whisper', 'diarization', 'summarizer', 'sentiment'])
+    registry.add_argument("--server-job", choices=['summarize', 'sentiment', 'transcribe'])
+    registry.add_argument("--server-args", nargs="*", default=[])
+    registry.add_argument("--address", default=None, help="Model server socket (defaults to the registry's)")
+    registry.set_defaults(run=benchmark_registry)
+
+    sentiment = subparsers.add_parser("sentiment-backends", help="fp32 vs int8 vs ONNX sentiment parity, rows/s and peak memory")
+    sentiment.add_argument("--csv", default="sample.csv")
+    sentiment.add_argument("--backends", nargs="*", default=['fp32', 'int8', 'onnx'], choices=['fp32', 'int8', 'onnx'])
+    sentiment.add_argument("--repeat", type=int, default=10, help="Score the CSV rows this many times for steadier timings")
+    sentiment.set_defaults(run=benchmark_sentiment_backends)
+
+    summarizer = subparsers.add_parser("summarizer", help="Latency and tokens/s per summarization profile")
+    summarizer.add_argument("--transcript", default="transcription.txt")
+    summarizer.add_argument("--profiles", nargs="*", default=['greedy', 'fast', 'full'], choices=['greedy', 'fast', 'full'])
+    summarizer.set_defaults(run=benchmark_summarizer)
+
+    transcripts = subparsers.add_parser("transcripts", help="Files/min for the summarizer or topic stage over transcripts")
+    transcripts.add_argument("paths", nargs="+", help="Transcript files or directories")
+    transcripts.add_argument("--stage", default="summarizer", choices=["summarizer", "topics"])
+    transcripts.add_argument("--profile", default="greedy", choices=['greedy', 'fast', 'full'])
+    transcripts.set_defaults(run=benchmark_transcripts)
+
+    transcript_parser = subparsers.add_parser("parser", help="Transcript parsing speed over a synthetic corpus")
+    transcript_parser.add_argument("--transcript", default="panel_transcription.txt")
+    transcript_parser.add_argument("--size-mb", type=float, default=100)
+    transcript_parser.set_defaults(run=benchmark_parser)
+
+    nltk_startup = subparsers.add_parser("nltk-startup", help="nltk.download vs local NLTK resource check at startup")
+    nltk_startup.set_defaults(run=benchmark_nltk_startup)
+
+    args = parser.parse_args()
+    args.run(args)
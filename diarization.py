@@ -0,0 +1,147 @@
+import numpy as np
+
+# Function to turn a pyannote annotation into (start_time, end_time, speaker) tuples in time order
+def get_turns(diarization):
+    return [(turn.start, turn.end, speaker) for turn, _, speaker in diarization.itertracks(yield_label=True)]
+
+# Function to merge adjacent turns of the same speaker separated by less than max_gap_ms
+def merge_gaps(turns, max_gap_ms):
+    pending = None
+    for start_time, end_time, speaker in turns:
+        if pending and pending[2] == speaker and (start_time - pending[1]) * 1000 < max_gap_ms:
+            pending = (pending[0], max(pending[1], end_time), speaker)
+            continue
+        if pending:
+            yield pending
+        pending = (start_time, end_time, speaker)
+    if pending:
+        yield pending
+
+# Function to drop turns shorter than min_duration_ms, or absorb them into the neighbouring turn
+def handle_short_turns(turns, min_duration_ms, short_turns="absorb"):
+    previous = None
+    carried = None
+    for start_time, end_time, speaker in turns:
+        if (end_time - start_time) * 1000 < min_duration_ms:
+            if short_turns == "drop":
+                continue
+            # Absorb into the preceding turn, or into the next one if nothing has been emitted yet
+            if previous:
+                previous = (previous[0], max(previous[1], end_time), previous[2])
+            elif carried is None:
+                carried = (start_time, end_time, speaker)
+            else:
+                carried = (carried[0], max(carried[1], end_time), carried[2])
+            continue
+        if carried is not None:
+            start_time, carried = min(carried[0], start_time), None
+        if previous:
+            yield previous
+        previous = (start_time, end_time, speaker)
+    if previous:
+        yield previous
+    elif carried is not None:
+        # Nothing long enough followed to absorb the short turns, so keep their speech as a turn of its own
+        yield carried
+
+# Function to count turns passing through a generator into stats[key]
+def count_turns(turns, stats, key):
+    for turn in turns:
+        stats[key] += 1
+        yield turn
+
+# Function to coalesce micro-turns before transcription, streaming turns through the merge passes; gaps are
+# merged again after short turns are handled, so A, short B, A becomes one A turn;
+# pass a stats dict to have it filled with the turn counts before and after coalescing
+def coalesce_turns(turns, max_gap_ms=500, min_duration_ms=300, short_turns="absorb", stats=None):
+    if stats is not None:
+        stats.update(turns_in=0, turns_out=0)
+        turns = count_turns(turns, stats, 'turns_in')
+    merged = handle_short_turns(merge_gaps(turns, max_gap_ms), min_duration_ms, short_turns)
+    merged = merge_gaps(merged, max_gap_ms)
+    if stats is not None:
+        merged = count_turns(merged, stats, 'turns_out')
+    return merged
+
+# Function to map one window's local speaker labels onto global speakers by embedding cosine similarity
+def match_speakers(labels, embeddings, centroids, similarity_threshold):
+    mapping = {}
+    pairs = []
+    for i, embedding in enumerate(embeddings):
+        if np.isnan(embedding).any():
+            continue
+        for speaker, (total, count) in centroids.items():
+            if count == 0:
+                continue
+            mean = total / count
+            similarity = float(np.dot(embedding, mean) / (np.linalg.norm(embedding) * np.linalg.norm(mean) + 1e-8))
+            if similarity >= similarity_threshold:
+                pairs.append((similarity, i, speaker))
+
+    # Greedily pair the most similar local/global speakers, each used at most once per window
+    used = set()
+    for similarity, i, speaker in sorted(pairs, reverse=True):
+        if labels[i] not in mapping and speaker not in used:
+            mapping[labels[i]] = speaker
+            used.add(speaker)
+
+    # Unmatched local speakers become new global speakers
+    for i, label in enumerate(labels):
+        if label not in mapping:
+            mapping[label] = f"SPEAKER_{len(centroids):02d}"
+            centroids[mapping[label]] = (np.zeros_like(embeddings[i]), 0)
+        if not np.isnan(embeddings[i]).any():
+            total, count = centroids[mapping[label]]
+            centroids[mapping[label]] = (total + embeddings[i], count + 1)
+    return mapping
+
+# Function to diarize a recording in fixed-length overlapping windows, yielding turns as each window finishes;
+# a turn cut off at a window's end is held back and extended by its continuation in the next window
+def diarize_chunked(pipeline, audio, sample_rate, chunk_seconds=600, overlap_seconds=30, similarity_threshold=0.6,
+                    edge_tolerance=0.5):
+    import torch
+    total_seconds = len(audio) / sample_rate
+    centroids = {}
+    carried = []
+    previous_end = 0.0
+    chunk_start = 0.0
+
+    while chunk_start < total_seconds:
+        chunk_end = min(chunk_start + chunk_seconds, total_seconds)
+        waveform = torch.from_numpy(audio[int(chunk_start * sample_rate):int(chunk_end * sample_rate)])[None]
+        annotation, embeddings = pipeline({"waveform": waveform, "sample_rate": sample_rate}, return_embeddings=True)
+        mapping = match_speakers(annotation.labels(), embeddings, centroids, similarity_threshold)
+
+        # Each window owns the turns that start between the midpoints of its overlaps with its neighbours
+        lower = chunk_start + overlap_seconds / 2 if chunk_start > 0 else 0.0
+        upper = chunk_end - overlap_seconds / 2 if chunk_end < total_seconds else float('inf')
+        turns = []
+        for turn, _, label in annotation.itertracks(yield_label=True):
+            start_time, end_time, speaker = chunk_start + turn.start, chunk_start + turn.end, mapping[label]
+            if lower <= start_time < upper:
+                turns.append((start_time, end_time, speaker))
+            elif start_time < lower and end_time > previous_end:
+                # A turn running past the previous window's end continues a carried turn of the same speaker,
+                # or else is speech the previous window missed, clipped to start where that window stopped
+                for i, (carried_start, carried_end, carried_speaker) in enumerate(carried):
+                    if carried_speaker == speaker and start_time <= carried_end:
+                        carried[i] = (carried_start, max(carried_end, end_time), speaker)
+                        break
+                else:
+                    if end_time - previous_end > edge_tolerance:
+                        turns.append((previous_end, end_time, speaker))
+        turns = sorted(carried + turns)
+
+        # Hold back the first turn cut off at this window's end, and every turn after it to keep time order
+        carried = []
+        if chunk_end < total_seconds:
+            for i, (_, end_time, _) in enumerate(turns):
+                if chunk_end - end_time <= edge_tolerance:
+                    turns, carried = turns[:i], turns[i:]
+                    break
+        yield from turns
+
+        if chunk_end >= total_seconds:
+            break
+        previous_end = chunk_end
+        chunk_start += chunk_seconds - overlap_seconds
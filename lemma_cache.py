@@ -0,0 +1,107 @@
+import json
+import os
+from collections import OrderedDict
+
+# Default file the shared lemma cache is persisted to between runs; the CLIs' --lemma-cache option overrides it
+LEMMA_CACHE_PATH = 'lemma_cache.json'
+
+# Bounded least-recently-used cache in front of the WordNet lemmatizer
+class LemmaCache:
+    def __init__(self, maxsize=100000, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.lemmas = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lemmatizer = None
+        self.loaded = False
+        # Entries looked up since the last pop_new_lemmas call, for handing back from worker processes
+        self.new_lemmas = {}
+
+    # Function to warm the cache from a previous run, treating a missing or unreadable file as an empty cache
+    def load(self):
+        self.loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable lemma cache {self.path}: {e}")
+            return
+        if isinstance(saved, dict):
+            self.lemmas.update(list(saved.items())[-self.maxsize:])
+
+    # Function to change the file the cache is loaded from and saved to; None keeps the cache in memory only
+    def set_path(self, path):
+        self.path = path or None
+        self.loaded = False
+
+    # Function to lemmatize a word, reading the saved cache on the first lookup and creating the WordNet
+    # lemmatizer (and loading WordNet) only on the first miss
+    def lemmatize(self, word):
+        if not self.loaded:
+            self.load()
+        lemma = self.lemmas.get(word)
+        if lemma is not None:
+            self.hits += 1
+            self.lemmas.move_to_end(word)
+            return lemma
+
+        self.misses += 1
+        if self.lemmatizer is None:
+            from nltk.stem import WordNetLemmatizer
+            self.lemmatizer = WordNetLemmatizer()
+        lemma = self.lemmatizer.lemmatize(word)
+        self.lemmas[word] = lemma
+        self.new_lemmas[word] = lemma
+        if len(self.lemmas) > self.maxsize:
+            self.lemmas.popitem(last=False)
+        return lemma
+
+    # Function to take the entries added since the last call, e.g. to send them from a worker to its parent
+    def pop_new_lemmas(self):
+        new_lemmas, self.new_lemmas = self.new_lemmas, {}
+        return new_lemmas
+
+    # Function to add entries looked up elsewhere, such as in worker processes, so they are saved with this cache
+    def merge(self, lemmas):
+        if not self.loaded:
+            self.load()
+        self.lemmas.update(lemmas)
+        while len(self.lemmas) > self.maxsize:
+            self.lemmas.popitem(last=False)
+
+    # Function to get the fraction of lookups answered from the cache
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    # Function to print the cache statistics
+    def report(self):
+        print(f"Lemma cache: {self.hits} hits, {self.misses} misses ({self.hit_rate():.1%} hit rate), "
+              f"{len(self.lemmas)} entries")
+
+    # Function to persist the cache for the next run, replacing the file only once the new copy is complete so an
+    # interrupted or concurrent save never leaves a truncated cache behind
+    def save(self):
+        if self.path:
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.lemmas, f)
+                os.replace(temp_path, self.path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+# Lemma cache shared by the meta_data and topic_modelling preprocessing
+lemma_cache = LemmaCache(path=LEMMA_CACHE_PATH)
+
+# Function to lemmatize a word through the shared cache
+def lemmatize(word):
+    return lemma_cache.lemmatize(word)
+
+# Function to point the shared cache at another file, e.g. from a CLI option or a worker process initializer
+def set_lemma_cache_path(path):
+    lemma_cache.set_path(path)
@@ -1,54 +1,237 @@
-import pandas as pd
+import argparse
+import os
 from collections import Counter
-import nltk
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import pandas as pd
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction import DictVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
+from lemma_cache import LEMMA_CACHE_PATH, lemma_cache, lemmatize, set_lemma_cache_path
+from nltk_resources import ensure_nltk_resources
+from speaker_store import (
+    SPEAKER_STORE_PATH, file_digest, ingested_transcripts, load_totals, open_store, replace_totals, stored_digest
+)
 
-# Ensure NLTK resources are downloaded
-nltk.download('punkt')
-nltk.download('stopwords')
-nltk.download('wordnet')
+# Ensure NLTK resources are available locally
+ensure_nltk_resources('punkt', 'stopwords', 'wordnet')
 
-# Initialize NLP utilities
-lemmatizer = WordNetLemmatizer()
+# Initialize NLP utilities; lemmas come from the shared cache, which loads WordNet on its first miss
 stop_words = set(stopwords.words('english'))
 
+# Number of keywords kept per speaker in the top-k tables
+TOP_K = 10
+
+# Rows read from the CSV per chunk, and how many chunks each worker may have queued at once
+CHUNK_ROWS = 5000
+CHUNKS_PER_WORKER = 2
+
 # Function to preprocess text (tokenize, remove stopwords, lemmatize)
 def preprocess_text(text):
     tokens = word_tokenize(text.lower())  # Tokenize and lowercase
     # Remove stopwords and non-alphabetic words, then lemmatize
-    tokens = [lemmatizer.lemmatize(word) for word in tokens if word.isalpha() and word not in stop_words]
+    tokens = [lemmatize(word) for word in tokens if word.isalpha() and word not in stop_words]
     return tokens
 
-df = pd.read_csv('sample.csv')
+# Function to create empty per-speaker aggregates, plus the lemma cache statistics and new entries behind them
+def new_totals():
+    return {'duration': Counter(), 'segments': Counter(), 'terms': {}, 'lemma_hits': 0, 'lemma_misses': 0,
+            'lemmas': {}}
+
+# Function to build a sparse speaker x term count matrix for one chunk of rows, with one vocabulary per chunk
+def speaker_term_matrix(documents, speakers):
+    vectorizer = CountVectorizer(analyzer=preprocess_text)
+    try:
+        row_terms = vectorizer.fit_transform(documents)
+    except ValueError:
+        # No term survived preprocessing in this chunk
+        return None, None, None
+
+    # Sum each speaker's rows with a sparse speaker x row membership matrix
+    speaker_names, speaker_index = np.unique(speakers, return_inverse=True)
+    rows = np.arange(len(speaker_index))
+    membership = sparse.csr_matrix((np.ones(len(rows), dtype=np.int64), (speaker_index, rows)),
+                                   shape=(len(speaker_names), len(rows)))
+    return (membership @ row_terms).tocsr(), speaker_names, vectorizer.get_feature_names_out()
+
+# Function to aggregate one chunk of rows: speaking time, segment count and keyword counts per speaker
+def aggregate_chunk(chunk):
+    hits, misses = lemma_cache.hits, lemma_cache.misses
+    totals = new_totals()
+
+    # Handle NaN or non-string values in the 'document' column
+    documents = chunk['document'].apply(lambda x: x if isinstance(x, str) else '')
+    speakers = chunk['speaker'].astype(str)
+    totals['duration'].update(chunk.groupby(speakers)['duration'].sum().to_dict())
+    totals['segments'].update(speakers.value_counts().to_dict())
+
+    # Keep only the chunk's non-zero speaker x term counts, so chunks with different vocabularies can be merged
+    counts, speaker_names, terms = speaker_term_matrix(documents, speakers.to_numpy())
+    if counts is not None:
+        for i, speaker in enumerate(speaker_names):
+            row = counts[i]
+            totals['terms'][speaker] = Counter(dict(zip(terms[row.indices], row.data.tolist())))
+
+    # Hand back the lemma cache statistics and new entries, so a worker's lookups reach the parent's saved cache
+    totals['lemma_hits'] = lemma_cache.hits - hits
+    totals['lemma_misses'] = lemma_cache.misses - misses
+    totals['lemmas'] = lemma_cache.pop_new_lemmas()
+    return totals
+
+# Function to fold one set of per-speaker aggregates into another
+def merge_totals(totals, other):
+    totals['duration'].update(other['duration'])
+    totals['segments'].update(other['segments'])
+    for speaker, terms in other['terms'].items():
+        totals['terms'].setdefault(speaker, Counter()).update(terms)
+    totals['lemma_hits'] += other['lemma_hits']
+    totals['lemma_misses'] += other['lemma_misses']
+    totals['lemmas'].update(other['lemmas'])
+    return totals
+
+# Function to aggregate chunks in a process pool, keeping only a few chunks in flight so memory stays bounded
+def aggregate_chunks(chunks, n_workers):
+    if n_workers <= 1:
+        yield from map(aggregate_chunk, chunks)
+        return
+
+    # Workers warm their lemma caches from the same file as this process
+    with ProcessPoolExecutor(n_workers, initializer=set_lemma_cache_path, initargs=(lemma_cache.path,)) as pool:
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(aggregate_chunk, chunk))
+            if len(pending) >= n_workers * CHUNKS_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
+
+# Function to aggregate a CSV of segments chunk by chunk, merging per-speaker totals as each chunk finishes
+def aggregate_csv(csv_path, n_workers=1, chunk_rows=CHUNK_ROWS):
+    chunks = pd.read_csv(csv_path, usecols=['speaker', 'duration', 'document'], chunksize=chunk_rows)
+    totals = new_totals()
+    for chunk_totals in aggregate_chunks(chunks, n_workers):
+        merge_totals(totals, chunk_totals)
+    return totals
+
+# Function to take the k highest-weighted terms of every row of a CSR matrix
+def top_terms(matrix, terms, k=TOP_K):
+    top = []
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        values, columns = matrix.data[start:end], matrix.indices[start:end]
+        best = np.argsort(-values, kind='stable')[:k]
+        top.append([(terms[columns[i]], round(float(values[i]), 4)) for i in best])
+    return top
+
+# Function to build the speaker summary table from per-speaker totals, with keyword tables computed on a sparse
+# speaker x term matrix over one shared vocabulary
+def build_speaker_summary(totals):
+    speakers = sorted(totals['duration'])
+    term_counts = [totals['terms'].get(speaker, Counter()) for speaker in speakers]
+
+    # With no terms at all (no rows, or only empty or stopword-only documents) there is nothing to vectorize
+    if any(term_counts):
+        vectorizer = DictVectorizer(dtype=np.int64)
+        counts = vectorizer.fit_transform(term_counts).tocsr()
+        tfidf = TfidfTransformer().fit_transform(counts).tocsr()
+        terms = vectorizer.get_feature_names_out()
+        keyword_frequency = [Counter(dict(zip(terms[counts[i].indices], counts[i].data.tolist())))
+                             for i in range(len(speakers))]
+        top_keywords, top_tfidf_keywords = top_terms(counts, terms), top_terms(tfidf, terms)
+    else:
+        keyword_frequency = [Counter() for _ in speakers]
+        top_keywords, top_tfidf_keywords = [[] for _ in speakers], [[] for _ in speakers]
 
-# Step 1: Handle NaN or non-string values in the 'document' column
-df['document'] = df['document'].apply(lambda x: str(x) if isinstance(x, str) else '')
+    return pd.DataFrame({
+        'speaker': speakers,
+        'duration': [totals['duration'][speaker] for speaker in speakers],
+        'segments': [totals['segments'][speaker] for speaker in speakers],
+        'keyword_frequency': keyword_frequency,
+        'top_keywords': top_keywords,
+        'top_tfidf_keywords': top_tfidf_keywords,
+    }, columns=['speaker', 'duration', 'segments', 'keyword_frequency', 'top_keywords', 'top_tfidf_keywords'])
 
-# Step 2: Get the number of unique speakers
-num_speakers = df['speaker'].nunique()
+# Function to store the per-speaker aggregates of each (transcript_id, csv_path) pair; a transcript without an
+# explicit id is keyed by its content digest, so a new meeting written to the same sample.csv is added alongside
+# the earlier ones, while an explicit id replaces that transcript's earlier contribution; unchanged transcripts are
+# skipped, so the work done is proportional to the new or changed meetings only
+def update_store(conn, transcripts, n_workers=1, chunk_rows=CHUNK_ROWS):
+    lemma_stats = {'lemma_hits': 0, 'lemma_misses': 0, 'lemmas': {}}
+    for transcript_id, csv_path in transcripts:
+        digest = file_digest(csv_path)
+        transcript_id = transcript_id or digest
+        previous = stored_digest(conn, transcript_id)
+        if previous == digest:
+            print(f"Skipping {csv_path}: transcript '{transcript_id}' is unchanged in the speaker store")
+            continue
+        totals = aggregate_csv(csv_path, n_workers, chunk_rows)
+        replace_totals(conn, transcript_id, csv_path, digest, totals)
+        lemma_stats['lemma_hits'] += totals['lemma_hits']
+        lemma_stats['lemma_misses'] += totals['lemma_misses']
+        lemma_stats['lemmas'].update(totals['lemmas'])
+        print(f"{'Replaced' if previous else 'Added'} transcript '{transcript_id}' from {csv_path}: "
+              f"{sum(totals['segments'].values())} segments from {len(totals['duration'])} speakers")
+    return lemma_stats
 
-# Step 3: Group by speaker and calculate total speaking time
-speaker_duration = df.groupby('speaker')['duration'].sum()
+def main():
+    parser = argparse.ArgumentParser(description="Per-speaker speaking time and keyword summary of transcript CSVs")
+    parser.add_argument("csv_paths", nargs="*", default=["sample.csv"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--incremental", action="store_true",
+                        help="Store each new or changed transcript's aggregates in the speaker store, then render from it")
+    parser.add_argument("--transcript-id",
+                        help="Key of the single CSV's transcript in the store, replacing its earlier aggregates; "
+                             "defaults to each CSV's content digest, which adds every new meeting")
+    parser.add_argument("--render", action="store_true",
+                        help="Regenerate speaker_summary.html from the speaker store without reading any CSV")
+    parser.add_argument("--store", default=SPEAKER_STORE_PATH)
+    parser.add_argument("--lemma-cache", default=LEMMA_CACHE_PATH, help="Lemma cache file; pass '' to keep it in memory")
+    args = parser.parse_args()
+    if args.transcript_id and len(args.csv_paths) != 1:
+        parser.error("--transcript-id needs exactly one CSV")
+    set_lemma_cache_path(args.lemma_cache)
 
-# Step 4: Group by speaker and aggregate all their sentences into one document
-speaker_docs = df.groupby('speaker')['document'].apply(lambda x: ' '.join(x)).reset_index()
+    if args.incremental or args.render:
+        # Steps 1-5: Aggregate only new or changed transcripts into the persisted per-speaker totals, then sum them back
+        conn = open_store(args.store)
+        try:
+            transcripts = [(args.transcript_id, path) for path in args.csv_paths]
+            lemma_stats = {} if args.render else update_store(conn, transcripts, args.workers, args.chunk_rows)
+            totals = load_totals(conn)
+            totals.update(lemma_stats)
+            print(f"Speaker store {args.store}: {len(ingested_transcripts(conn))} transcripts")
+        finally:
+            conn.close()
+    else:
+        # Steps 1-5: Read the CSVs in chunks and aggregate speaking time, segments and keywords per speaker in parallel
+        totals = new_totals()
+        for csv_path in args.csv_paths:
+            merge_totals(totals, aggregate_csv(csv_path, args.workers, args.chunk_rows))
 
-# Step 5: NLP Preprocessing and Keyword Frequency Analysis
-def analyze_keywords(text):
-    tokens = preprocess_text(text)
-    return Counter(tokens)
+    # Step 6: Combine results into speaker_summary DataFrame
+    speaker_summary = build_speaker_summary(totals)
 
-# Add a new column with preprocessed keyword frequency for each speaker
-speaker_docs['keyword_frequency'] = speaker_docs['document'].apply(analyze_keywords)
+    # Save the final speaker_summary as HTML
+    speaker_summary.to_html('speaker_summary.html')
 
-# Step 6: Combine results into speaker_summary DataFrame
-speaker_summary = pd.merge(speaker_duration.reset_index(), speaker_docs, on='speaker')
+    # Report the lemma cache across all workers, and save the entries they added along with this process's cache
+    lookups = totals['lemma_hits'] + totals['lemma_misses']
+    if lookups:
+        print(f"Lemma cache: {totals['lemma_hits']} hits, {totals['lemma_misses']} misses "
+              f"({totals['lemma_hits'] / lookups:.1%} hit rate)")
+    if totals['lemmas']:
+        lemma_cache.merge(totals['lemmas'])
+        lemma_cache.save()
 
-# Save the final speaker_summary as HTML
-speaker_summary.to_html('speaker_summary.html')
+    # Output the number of speakers and the summary DataFrame
+    print(f"Number of unique speakers: {len(speaker_summary)}")
+    print(speaker_summary[['speaker', 'duration', 'keyword_frequency', 'top_tfidf_keywords']])
 
-# Output the number of speakers and the summary DataFrame
-print(f"Number of unique speakers: {num_speakers}")
-print(speaker_summary[['speaker', 'duration', 'keyword_frequency']])
+# Guard the entry point so worker processes can import this module safely
+if __name__ == "__main__":
+    main()
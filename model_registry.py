@@ -0,0 +1,226 @@
+import argparse
+import getpass
+import os
+import stat
+import tempfile
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+# Models loaded in this process, keyed by (kind, checkpoint, ...), and how long each took to load
+models = {}
+load_times = {}
+lock = threading.RLock()
+
+# The model server listens on a Unix socket on POSIX systems and on a named pipe on Windows
+POSIX = os.name == 'posix'
+
+# Function to return a cached model, loading it on first use and reporting the cold-start time
+def get_model(key, loader):
+    with lock:
+        if key not in models:
+            start = time.perf_counter()
+            models[key] = loader()
+            load_times[key] = time.perf_counter() - start
+            print(f"Loaded {key[0]} '{key[1]}' in {load_times[key]:.2f}s (cold start)")
+        return models[key]
+
+# Function to load the Hugging Face token from file
+def read_hf_token(path='hugging face token.txt'):
+    with open(path, 'r') as f:
+        return f.read().strip()
+
+# Function to get a Whisper speech recognition model
+def get_whisper(name="base", device=None):
+    def load():
+        import whisper
+        return whisper.load_model(name, device=device)
+    return get_model(('whisper', name, device), load)
+
+# Function to get the Pyannote speaker diarization pipeline
+def get_diarization_pipeline(checkpoint='pyannote/speaker-diarization-3.1'):
+    def load():
+        from pyannote.audio import Pipeline
+        return Pipeline.from_pretrained(checkpoint, use_auth_token=read_hf_token())
+    return get_model(('diarization', checkpoint), load)
+
+# Function to get a T5 summarization model and its tokenizer
+def get_summarizer(checkpoint="t5-large"):
+    def load():
+        from transformers import T5ForConditionalGeneration, T5Tokenizer
+        return T5ForConditionalGeneration.from_pretrained(checkpoint), T5Tokenizer.from_pretrained(checkpoint)
+    return get_model(('summarizer', checkpoint), load)
+
+# Function to get the fast (Rust) tokenizer of a checkpoint
+def get_fast_tokenizer(checkpoint):
+    def load():
+        from transformers import AutoTokenizer
+        return AutoTokenizer.from_pretrained(checkpoint, use_fast=True)
+    return get_model(('tokenizer', checkpoint), load)
+
+# Function to get a sequence classification model and its fast tokenizer, both from the same checkpoint
+def get_sequence_classifier(checkpoint='distilbert-base-uncased-finetuned-sst-2-english'):
+    def load():
+        from transformers import AutoModelForSequenceClassification
+        return AutoModelForSequenceClassification.from_pretrained(checkpoint).eval(), get_fast_tokenizer(checkpoint)
+    return get_model(('classifier', checkpoint), load)
+
+# Function to get an int8 dynamically quantized copy of a sequence classification model for CPU inference
+def get_quantized_classifier(checkpoint='distilbert-base-uncased-finetuned-sst-2-english'):
+    def load():
+        import torch
+        from transformers import AutoModelForSequenceClassification
+        model = AutoModelForSequenceClassification.from_pretrained(checkpoint).eval()
+        quantized = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return quantized, get_fast_tokenizer(checkpoint)
+    return get_model(('classifier-int8', checkpoint), load)
+
+# Function to get an ONNX Runtime CPU session for an exported model
+def get_onnx_session(onnx_path):
+    def load():
+        import onnxruntime
+        return onnxruntime.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+    return get_model(('onnx', onnx_path), load)
+
+# Function to get a model's configuration
+def get_config(checkpoint):
+    def load():
+        from transformers import AutoConfig
+        return AutoConfig.from_pretrained(checkpoint)
+    return get_model(('config', checkpoint), load)
+
+# Function to run a summarization job on the server
+def summarize_job(text, profile="full"):
+    from text_summarizer import clean_text, summarize
+    return summarize(clean_text(text), profile)
+
+# Function to run a sentiment job on the server over a list of texts
+def sentiment_job(texts):
+    from sentiment_analysis import get_sentiments
+    return get_sentiments(texts)
+
+# Function to run a transcription job on the server for one WAV file
+def transcribe_job(audio_wav_path):
+    import audio_transcriptor
+    return audio_transcriptor.main(audio_wav_path)
+
+# Jobs the model server accepts, by name
+JOBS = {
+    'summarize': summarize_job,
+    'sentiment': sentiment_job,
+    'transcribe': transcribe_job,
+}
+
+# Function to get the per-user directory holding the model server's socket and the key file clients must present
+# before the server unpickles anything they send
+def server_directory():
+    if POSIX:
+        return os.path.join(tempfile.gettempdir(), f"discernai-{os.getuid()}")
+    return os.path.join(os.environ.get('LOCALAPPDATA') or tempfile.gettempdir(), 'discernai')
+
+# Function to get the default model server address: a socket in the private directory, or a per-user named pipe
+def default_address():
+    if POSIX:
+        return os.path.join(server_directory(), "models.sock")
+    return rf"\\.\pipe\discernai_models_{getpass.getuser()}"
+
+# Function to get the default path of the model server's key file
+def default_authkey_path():
+    return os.path.join(server_directory(), "authkey")
+
+# Function to check that a file or directory belongs to this user and is closed to everyone else (POSIX only)
+def check_private(path, kind, mode):
+    if not POSIX:
+        return
+    info = os.stat(path)
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"Model server {kind} must be owned by this user with mode {mode}: {path}")
+
+# Function to create a directory only this user can access, refusing one that another user owns or can enter
+def private_directory(path):
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    check_private(path, "directory", "0700")
+    return path
+
+# Function to read the server's authentication key, creating a random one readable only by this user on first use
+def read_authkey(path=None):
+    path = path or default_authkey_path()
+    private_directory(os.path.dirname(path) or '.')
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        pass
+    else:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(os.urandom(32))
+
+    check_private(path, "key file", "0600")
+    with open(path, 'rb') as f:
+        return f.read()
+
+# Function to receive one job from a client, run it and send back the result; a client that disconnects or
+# sends a bad request only loses its own job
+def handle_connection(conn):
+    try:
+        job, args = conn.recv()
+    except Exception as e:
+        print(f"Dropped a request that could not be read: {type(e).__name__}: {e}")
+        return
+
+    start = time.perf_counter()
+    try:
+        reply = ('ok', JOBS[job](*args), time.perf_counter() - start)
+    except Exception as e:
+        reply = ('error', f"{type(e).__name__}: {e}", time.perf_counter() - start)
+    try:
+        conn.send(reply)
+    except Exception as e:
+        print(f"Could not send the result of job '{job}': {type(e).__name__}: {e}")
+    print(f"Job '{job}' finished in {time.perf_counter() - start:.2f}s")
+
+# Function to serve jobs over a local socket so repeated jobs reuse the models already loaded here
+def serve(address=None, preload=(), authkey_path=None):
+    address = address or default_address()
+    authkey = read_authkey(authkey_path)
+    if POSIX:
+        private_directory(os.path.dirname(address) or '.')
+    for name in preload:
+        {'whisper': get_whisper, 'diarization': get_diarization_pipeline,
+         'summarizer': get_summarizer, 'sentiment': get_sequence_classifier}[name]()
+
+    # Only replace a stale socket left by a previous server, never some other file at that path
+    if POSIX and os.path.lexists(address):
+        if not stat.S_ISSOCK(os.lstat(address).st_mode):
+            raise FileExistsError(f"Refusing to replace a file that is not a socket: {address}")
+        os.remove(address)
+    with Listener(address, family='AF_UNIX' if POSIX else 'AF_PIPE', authkey=authkey) as listener:
+        print(f"Model server listening on {address}")
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, EOFError, OSError) as e:
+                print(f"Rejected a connection: {type(e).__name__}: {e}")
+                continue
+            with conn:
+                handle_connection(conn)
+
+# Function to submit a job to a running model server and return its result
+def submit(job, *args, address=None, authkey_path=None):
+    start = time.perf_counter()
+    family = 'AF_UNIX' if POSIX else 'AF_PIPE'
+    with Client(address or default_address(), family=family, authkey=read_authkey(authkey_path)) as conn:
+        conn.send((job, args))
+        status, result, job_seconds = conn.recv()
+    if status != 'ok':
+        raise RuntimeError(f"Model server job '{job}' failed: {result}")
+    print(f"Job '{job}' took {job_seconds:.2f}s on the server, {time.perf_counter() - start:.2f}s end to end")
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Long-lived DiscernAI model server")
+    parser.add_argument("--address", default=None, help="Socket path or named pipe (defaults to a per-user one)")
+    parser.add_argument("--preload", nargs="*", default=[], choices=['whisper', 'diarization', 'summarizer', 'sentiment'])
+    parser.add_argument("--authkey-file", default=None, help="Key file clients must share (created 0600 on POSIX)")
+    args = parser.parse_args()
+    serve(args.address, args.preload, args.authkey_file)
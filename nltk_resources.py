@@ -0,0 +1,52 @@
+import argparse
+import os
+import nltk
+from nltk.tokenize import punkt
+
+# Local NLTK data directory; NLTK_DATA overrides it, e.g. for a shared read-only copy on air-gapped workers
+NLTK_DATA_DIR = os.environ.get('NLTK_DATA', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nltk_data'))
+
+# NLTK packages the stages use, and where each one lives inside a data directory; newer NLTK releases
+# tokenize with the pickle-free punkt_tab tables instead of punkt
+RESOURCES = {
+    'punkt': 'tokenizers/punkt_tab' if hasattr(punkt, 'PunktTokenizer') else 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+}
+
+# Resources already verified in this process
+verified = set()
+
+# Function to make sure NLTK resources are available locally, without touching the network
+def ensure_nltk_resources(*names):
+    if NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, NLTK_DATA_DIR)
+
+    missing = []
+    for name in names:
+        if name in verified:
+            continue
+        try:
+            nltk.data.find(RESOURCES[name])
+            verified.add(name)
+        except LookupError:
+            missing.append(name)
+    if missing:
+        raise LookupError(f"Missing NLTK resources {missing} in {nltk.data.path}; "
+                          f"run 'python nltk_resources.py --download' once on a machine with network access")
+
+# Function to download NLTK resources into the local data directory; the only place that uses the network
+def download_nltk_resources(*names):
+    for name in names or RESOURCES:
+        package = RESOURCES[name].split('/')[-1]
+        nltk.download(package, download_dir=NLTK_DATA_DIR)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify or fetch the local NLTK data the DiscernAI stages need")
+    parser.add_argument("--download", action="store_true", help="Download missing resources into the data directory")
+    args = parser.parse_args()
+
+    if args.download:
+        download_nltk_resources()
+    ensure_nltk_resources(*RESOURCES)
+    print(f"NLTK resources {sorted(RESOURCES)} available in {NLTK_DATA_DIR}")
@@ -1,41 +1,185 @@
+import os
+import time
+from types import SimpleNamespace
 import pandas as pd
-from transformers import pipeline, AutoTokenizer
-import matplotlib.pyplot as plt
 import torch
+from model_registry import get_config, get_fast_tokenizer, get_onnx_session, get_quantized_classifier, get_sequence_classifier
 
-# Convert to DataFrame
-df = pd.read_csv('sample.csv')
+# Checkpoint of the default sentiment-analysis pipeline; its tokenizer and model are always loaded together
+SENTIMENT_CHECKPOINT = 'distilbert-base-uncased-finetuned-sst-2-english'
 
-# Check the column names to ensure 'document' exists
-print(df.columns)
+# Inference backends: fp32 eager PyTorch, int8 dynamic-quantized PyTorch, or ONNX Runtime
+BACKENDS = ('fp32', 'int8', 'onnx')
 
-# Handle NaN by filling missing text with an empty string and convert all values to strings
-df['text'] = df['document'].fillna('').astype(str)
+# Directory holding exported ONNX models
+ONNX_DIR = 'onnx_models'
 
-# Load pre-trained sentiment analysis model and tokenizer
-classifier = pipeline('sentiment-analysis')
-tokenizer = AutoTokenizer.from_pretrained('distilbert-base-uncased')
+# Function to get the path of a checkpoint's exported ONNX model
+def onnx_path_for(checkpoint):
+    return os.path.join(ONNX_DIR, checkpoint.replace('/', '__') + '.onnx')
+
+# Function to export a checkpoint to ONNX with dynamic batch and sequence axes
+def export_onnx(checkpoint, onnx_path):
+    from transformers import AutoModelForSequenceClassification
+
+    os.makedirs(os.path.dirname(onnx_path), exist_ok=True)
+    model = AutoModelForSequenceClassification.from_pretrained(checkpoint).eval()
+    model.config.return_dict = False
+    inputs = get_fast_tokenizer(checkpoint)(["export"], return_tensors='pt')
+    torch.onnx.export(model, (inputs['input_ids'], inputs['attention_mask']), onnx_path,
+                      input_names=['input_ids', 'attention_mask'], output_names=['logits'],
+                      dynamic_axes={'input_ids': {0: 'batch', 1: 'sequence'},
+                                    'attention_mask': {0: 'batch', 1: 'sequence'},
+                                    'logits': {0: 'batch'}},
+                      opset_version=14)
+
+# Wrapper giving an ONNX Runtime session the same call interface as the PyTorch model
+class OnnxClassifier:
+    def __init__(self, session, config):
+        self.session = session
+        self.config = config
+        self.input_names = [i.name for i in session.get_inputs()]
+
+    def __call__(self, **inputs):
+        feeds = {name: inputs[name].numpy() for name in self.input_names}
+        return SimpleNamespace(logits=torch.from_numpy(self.session.run(['logits'], feeds)[0]))
+
+# Function to split a token sequence into overlapping windows that fit the model with its special tokens
+def split_windows(token_ids, window_size, stride):
+    windows = [token_ids[start:start + window_size] for start in range(0, max(len(token_ids) - window_size, 0) + 1, stride)]
+    # Make sure the tail of the sequence is covered by a final window
+    if len(token_ids) > window_size and (len(token_ids) - window_size) % stride:
+        windows.append(token_ids[-window_size:])
+    return windows
+
+# Sentiment scorer owning exactly one model/tokenizer pair from the same checkpoint
+class SentimentScorer:
+    def __init__(self, checkpoint=SENTIMENT_CHECKPOINT, backend='fp32'):
+        # Get the model and its fast tokenizer from the shared registry, timing the startup
+        start = time.perf_counter()
+        if backend == 'fp32':
+            self.model, self.tokenizer = get_sequence_classifier(checkpoint)
+        elif backend == 'int8':
+            self.model, self.tokenizer = get_quantized_classifier(checkpoint)
+        elif backend == 'onnx':
+            onnx_path = onnx_path_for(checkpoint)
+            if not os.path.exists(onnx_path):
+                export_onnx(checkpoint, onnx_path)
+            self.model = OnnxClassifier(get_onnx_session(onnx_path), get_config(checkpoint))
+            self.tokenizer = get_fast_tokenizer(checkpoint)
+        else:
+            raise ValueError(f"Unknown sentiment backend '{backend}', expected one of {BACKENDS}")
+        self.backend = backend
+        self.startup_seconds = time.perf_counter() - start
+
+    # Function to get sentiment labels and their probabilities for a list of texts in length-sorted, dynamically
+    # padded batches; texts longer than max_length tokens are scored as overlapping windows ("window") or cut at
+    # max_length ("truncate")
+    def classify(self, texts, batch_size=32, max_length=512, window_overlap=128, long_texts="window"):
+        start = time.perf_counter()
+
+        # Assign 'neutral' (with no score) for empty text or NaN, and only run the model on non-empty texts
+        sentiments = [('neutral', None)] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        if not indices:
+            return sentiments
+
+        # Batch-encode all input texts once, without special tokens, padding or truncation
+        token_ids = self.tokenizer([texts[i] for i in indices], add_special_tokens=False, verbose=False)['input_ids']
+
+        # Split each text into windows leaving room for the special tokens; every window remembers its text
+        window_size = max_length - self.tokenizer.num_special_tokens_to_add()
+        windows = []
+        for j, ids in enumerate(token_ids):
+            text_windows = split_windows(ids, window_size, window_size - window_overlap)
+            if long_texts == "truncate":
+                text_windows = text_windows[:1]
+            windows.extend((j, self.tokenizer.build_inputs_with_special_tokens(window)) for window in text_windows)
+
+        # Sort windows by token count so each batch is padded only to its own longest sequence
+        windows.sort(key=lambda window: len(window[1]))
+        logit_sums = [0] * len(indices)
+        token_counts = [0] * len(indices)
+        with torch.inference_mode():
+            for batch_start in range(0, len(windows), batch_size):
+                batch = windows[batch_start:batch_start + batch_size]
+                inputs = self.tokenizer.pad({'input_ids': [ids for _, ids in batch]}, return_tensors='pt')
+                logits = self.model(**inputs).logits
+
+                # Aggregate window logits per text, weighted by how many tokens each window covers
+                for (j, ids), window_logits in zip(batch, logits):
+                    logit_sums[j] = logit_sums[j] + window_logits * len(ids)
+                    token_counts[j] += len(ids)
+
+        # Write each prediction back at the text's original position
+        for j, i in enumerate(indices):
+            probabilities = torch.softmax(logit_sums[j] / token_counts[j], dim=-1)
+            prediction = torch.argmax(probabilities).item()
+            sentiments[i] = (self.model.config.id2label[prediction], probabilities[prediction].item())
+
+        elapsed = time.perf_counter() - start
+        tokens = sum(token_counts)
+        long_count = sum(len(ids) > window_size for ids in token_ids)
+        print(f"Scored {len(windows)} windows for {len(indices)} texts ({long_count} longer than {max_length} tokens): "
+              f"{tokens} tokens in {elapsed:.2f}s, {tokens / elapsed:.0f} tokens/s")
+        return sentiments
+
+    # Function to get sentiment labels for a list of texts
+    def score(self, texts, **kwargs):
+        return [label for label, _ in self.classify(texts, **kwargs)]
+
+# Function to get sentiment for a list of texts with the default checkpoint on the chosen backend
+def get_sentiments(texts, backend='fp32', **kwargs):
+    return SentimentScorer(backend=backend).score(texts, **kwargs)
 
 # Function to get sentiment
-def get_sentiment(text):
-    if text.strip():  # Ensure we have non-empty text
-        # Tokenize and truncate input text
-        inputs = tokenizer(text, truncation=True, max_length=512, return_tensors='pt', padding='max_length')
-        outputs = classifier.model(**inputs)
-        prediction = torch.argmax(outputs.logits, dim=1).item()
-        sentiment = classifier.model.config.id2label[prediction]
-        return sentiment
-    return 'neutral'  # Assign 'neutral' for empty text or NaN
-
-# Apply sentiment analysis on the cleaned 'text' column
-df['sentiment'] = df['text'].apply(get_sentiment)
-
-# Group by speaker and get sentiment counts
-speaker_sentiments = df.groupby(['speaker', 'sentiment']).size().unstack(fill_value=0)
-
-# Plotting the sentiment distribution for each speaker
-speaker_sentiments.plot(kind='bar', stacked=True)
-plt.title('Sentiment Distribution by Speaker')
-plt.xlabel('Speakers')
-plt.ylabel('Count of Sentiments')
-plt.show()
+def get_sentiment(text, backend='fp32'):
+    return get_sentiments([text], backend=backend)[0]
+
+# Output files: per-segment results, the per-speaker table and the rendered chart
+SEGMENT_SENTIMENTS_PATH = 'sentiment.parquet'
+SPEAKER_SENTIMENTS_PATH = 'speaker_sentiments.parquet'
+CHART_PATH = 'sentiment_distribution.png'
+
+if __name__ == "__main__":
+    # Render off-screen so the stage never blocks on headless workers
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    # Load the sentiment model and tokenizer once; set backend to 'int8' or 'onnx' for faster CPU inference
+    backend = 'fp32'
+    scorer = SentimentScorer(backend=backend)
+    print(f"Sentiment model startup ({backend}): {scorer.startup_seconds:.2f}s")
+
+    # Convert to DataFrame
+    df = pd.read_csv('sample.csv')
+
+    # Check the column names to ensure 'document' exists
+    print(df.columns)
+
+    # Handle NaN by filling missing text with an empty string and convert all values to strings
+    df['text'] = df['document'].fillna('').astype(str)
+
+    # Apply sentiment analysis on the cleaned 'text' column
+    results = scorer.classify(df['text'].tolist())
+    df['sentiment'] = [label for label, _ in results]
+    df['sentiment_score'] = [score for _, score in results]
+
+    # Persist the per-segment labels and scores so later stages don't rerun the model
+    df[['speaker', 'duration', 'text', 'sentiment', 'sentiment_score']].to_parquet(SEGMENT_SENTIMENTS_PATH, index=False)
+
+    # Group by speaker and get sentiment counts
+    speaker_sentiments = df.groupby(['speaker', 'sentiment']).size().unstack(fill_value=0)
+    speaker_sentiments.columns = speaker_sentiments.columns.astype(str)
+    speaker_sentiments.reset_index().to_parquet(SPEAKER_SENTIMENTS_PATH, index=False)
+
+    # Plotting the sentiment distribution for each speaker
+    speaker_sentiments.plot(kind='bar', stacked=True)
+    plt.title('Sentiment Distribution by Speaker')
+    plt.xlabel('Speakers')
+    plt.ylabel('Count of Sentiments')
+    plt.tight_layout()
+    plt.savefig(CHART_PATH)
+    plt.close()
+    print(f"Saved {SEGMENT_SENTIMENTS_PATH}, {SPEAKER_SENTIMENTS_PATH} and {CHART_PATH}")
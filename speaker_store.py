@@ -0,0 +1,126 @@
+import hashlib
+import sqlite3
+import time
+from collections import Counter
+
+# SQLite file holding the per-speaker aggregates of every transcript ingested so far
+SPEAKER_STORE_PATH = 'speaker_store.db'
+
+# Each transcript's per-speaker contribution is kept so re-ingesting it can be subtracted again; the speakers and
+# speaker_terms tables hold the running totals over all transcripts that the view is rendered from
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    transcript_id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    segments INTEGER NOT NULL,
+    ingested_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transcript_speakers (
+    transcript_id TEXT NOT NULL,
+    speaker TEXT NOT NULL,
+    duration REAL NOT NULL,
+    segments INTEGER NOT NULL,
+    PRIMARY KEY (transcript_id, speaker)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS transcript_terms (
+    transcript_id TEXT NOT NULL,
+    speaker TEXT NOT NULL,
+    term TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (transcript_id, speaker, term)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS speakers (
+    speaker TEXT PRIMARY KEY,
+    duration REAL NOT NULL,
+    segments INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS speaker_terms (
+    speaker TEXT NOT NULL,
+    term TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (speaker, term)
+) WITHOUT ROWID;
+"""
+
+# Function to hash a transcript file's contents, so re-running on an unchanged transcript is skipped
+def file_digest(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Function to open the store, creating its tables on first use
+def open_store(path=SPEAKER_STORE_PATH):
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+# Function to get the digest a transcript had when it was last ingested, or None if it never was
+def stored_digest(conn, transcript_id):
+    row = conn.execute("SELECT digest FROM transcripts WHERE transcript_id = ?", (transcript_id,)).fetchone()
+    return row[0] if row else None
+
+# Function to add (sign=1) or subtract (sign=-1) one transcript's stored contribution to the running totals,
+# touching only that transcript's speakers and terms
+def apply_contribution(conn, transcript_id, sign):
+    conn.execute(
+        "INSERT INTO speakers (speaker, duration, segments) "
+        "SELECT speaker, ? * duration, ? * segments FROM transcript_speakers WHERE transcript_id = ? "
+        "ON CONFLICT (speaker) DO UPDATE SET duration = duration + excluded.duration, "
+        "segments = segments + excluded.segments",
+        (sign, sign, transcript_id)
+    )
+    conn.execute(
+        "INSERT INTO speaker_terms (speaker, term, count) "
+        "SELECT speaker, term, ? * count FROM transcript_terms WHERE transcript_id = ? "
+        "ON CONFLICT (speaker, term) DO UPDATE SET count = count + excluded.count",
+        (sign, transcript_id)
+    )
+    if sign < 0:
+        # Drop the speakers and terms this transcript was the only source of
+        conn.execute("DELETE FROM speakers WHERE segments <= 0 AND speaker IN "
+                     "(SELECT speaker FROM transcript_speakers WHERE transcript_id = ?)", (transcript_id,))
+        conn.execute("DELETE FROM speaker_terms WHERE count <= 0 AND (speaker, term) IN "
+                     "(SELECT speaker, term FROM transcript_terms WHERE transcript_id = ?)", (transcript_id,))
+
+# Function to store one transcript's per-speaker totals, subtracting whatever that transcript contributed before
+# and adding the new contribution; everything happens in one transaction so a transcript is never counted twice
+# or half
+def replace_totals(conn, transcript_id, path, digest, totals):
+    with conn:
+        apply_contribution(conn, transcript_id, -1)
+        for table in ('transcripts', 'transcript_speakers', 'transcript_terms'):
+            conn.execute(f"DELETE FROM {table} WHERE transcript_id = ?", (transcript_id,))
+
+        conn.execute("INSERT INTO transcripts (transcript_id, path, digest, segments, ingested_at) VALUES (?, ?, ?, ?, ?)",
+                     (transcript_id, path, digest, sum(totals['segments'].values()), time.time()))
+        conn.executemany(
+            "INSERT INTO transcript_speakers (transcript_id, speaker, duration, segments) VALUES (?, ?, ?, ?)",
+            [(transcript_id, speaker, float(duration), int(totals['segments'][speaker]))
+             for speaker, duration in totals['duration'].items()]
+        )
+        conn.executemany(
+            "INSERT INTO transcript_terms (transcript_id, speaker, term, count) VALUES (?, ?, ?, ?)",
+            [(transcript_id, speaker, term, int(count))
+             for speaker, terms in totals['terms'].items() for term, count in terms.items()]
+        )
+        apply_contribution(conn, transcript_id, 1)
+
+# Function to load the running per-speaker totals in the same shape as meta_data's per-speaker totals
+def load_totals(conn):
+    totals = {'duration': Counter(), 'segments': Counter(), 'terms': {}, 'lemma_hits': 0, 'lemma_misses': 0,
+              'lemmas': {}}
+    for speaker, duration, segments in conn.execute("SELECT speaker, duration, segments FROM speakers"):
+        totals['duration'][speaker] = duration
+        totals['segments'][speaker] = segments
+    for speaker, term, count in conn.execute("SELECT speaker, term, count FROM speaker_terms"):
+        totals['terms'].setdefault(speaker, Counter())[term] = count
+    return totals
+
+# Function to list the transcripts ingested so far, oldest first
+def ingested_transcripts(conn):
+    return conn.execute(
+        "SELECT transcript_id, path, digest, segments, ingested_at FROM transcripts ORDER BY ingested_at"
+    ).fetchall()
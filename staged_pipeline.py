@@ -0,0 +1,86 @@
+import queue
+import threading
+import time
+
+# Marker put on a queue when the stage feeding it has finished
+DONE = object()
+
+# Function to create the timing and queue-depth counters kept for each stage
+def new_stats(name):
+    return {'stage': name, 'items_in': 0, 'items_out': 0, 'busy_s': 0.0, 'waiting_s': 0.0,
+            'blocked_s': 0.0, 'max_queue_depth': 0, 'mean_queue_depth': 0.0}
+
+# Function to iterate over a stage's input queue, counting items, waiting time and queue depth; once the
+# pipeline is cancelled the remaining items are discarded so the upstream stage is never blocked on a full queue
+def queue_items(in_queue, stats, cancel=None):
+    while True:
+        wait_start = time.perf_counter()
+        item = in_queue.get()
+        stats['waiting_s'] += time.perf_counter() - wait_start
+        if item is DONE:
+            return
+        if cancel is not None and cancel.is_set():
+            continue
+        depth = in_queue.qsize() + 1
+        stats['items_in'] += 1
+        stats['max_queue_depth'] = max(stats['max_queue_depth'], depth)
+        stats['mean_queue_depth'] += (depth - stats['mean_queue_depth']) / stats['items_in']
+        yield item
+
+# Function to run one stage in its own thread: it maps an iterator of inputs to an iterator of outputs;
+# a failing stage sets cancel so every stage, the source included, stops doing work for the pipeline
+def run_stage(stage_fn, in_queue, out_queue, stats, errors, cancel):
+    started = time.perf_counter()
+    items = queue_items(in_queue, stats, cancel) if in_queue is not None else None
+    try:
+        for item in stage_fn(items) if items is not None else stage_fn():
+            if cancel.is_set():
+                break
+            put_start = time.perf_counter()
+            out_queue.put(item)
+            stats['blocked_s'] += time.perf_counter() - put_start
+            stats['items_out'] += 1
+    except BaseException as e:
+        errors.append((stats['stage'], e))
+        cancel.set()
+    finally:
+        # Keep draining so the upstream stages are never blocked on a full queue
+        if items is not None:
+            for _ in items:
+                pass
+        out_queue.put(DONE)
+        stats['busy_s'] = time.perf_counter() - started - stats['waiting_s'] - stats['blocked_s']
+
+# Function to run a source and a chain of stages concurrently, connected by bounded queues
+def run_stages(source_fn, stages, queue_size=16):
+    # stages is a list of (name, stage_fn) pairs; the source stage takes no input
+    stages = [('source', source_fn)] + list(stages)
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+    stats = [new_stats(name) for name, _ in stages]
+    errors = []
+    cancel = threading.Event()
+
+    threads = []
+    for i, (name, stage_fn) in enumerate(stages):
+        in_queue = queues[i - 1] if i > 0 else None
+        thread = threading.Thread(target=run_stage, name=name, daemon=True,
+                                  args=(stage_fn, in_queue, queues[i], stats[i], errors, cancel))
+        thread.start()
+        threads.append(thread)
+
+    # Collect the final stage's outputs on the calling thread
+    results = list(queue_items(queues[-1], new_stats('collect')))
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        name, error = errors[0]
+        raise RuntimeError(f"Pipeline stage '{name}' failed: {error}") from error
+    return results, stats
+
+# Function to print the per-stage counters so the bottleneck stage stands out
+def print_stats(stats):
+    print(f"{'stage':<16}{'in':>8}{'out':>8}{'busy s':>10}{'waiting s':>11}{'blocked s':>11}{'max q':>7}{'mean q':>8}")
+    for s in stats:
+        print(f"{s['stage']:<16}{s['items_in']:>8}{s['items_out']:>8}{s['busy_s']:>10.2f}{s['waiting_s']:>11.2f}"
+              f"{s['blocked_s']:>11.2f}{s['max_queue_depth']:>7}{s['mean_queue_depth']:>8.1f}")
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from diarization import coalesce_turns, diarize_chunked
+
+SAMPLE_RATE = 100
+
+# Minimal stand-ins for pyannote's Segment and Annotation
+class FakeTurn:
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+class FakeAnnotation:
+    def __init__(self, tracks):
+        self.tracks = tracks
+
+    def labels(self):
+        return sorted({label for _, _, label in self.tracks})
+
+    def itertracks(self, yield_label=False):
+        for start, end, label in self.tracks:
+            yield FakeTurn(start, end), None, label
+
+# Stub diarization pipeline that reports global (start, end, label) speech, cropped to the window it is given
+class FakePipeline:
+    def __init__(self, speech, step):
+        self.speech = speech
+        self.step = step
+        self.windows = []
+
+    def __call__(self, file, return_embeddings=False):
+        duration = file["waveform"].shape[-1] / file["sample_rate"]
+        # Windows are requested in order, each starting one step after the last
+        window_start = self.windows[-1] + self.step if self.windows else 0.0
+        self.windows.append(window_start)
+        tracks = [(max(start, window_start) - window_start, min(end, window_start + duration) - window_start, label)
+                  for start, end, label in self.speech if start < window_start + duration and end > window_start]
+        labels = sorted({label for _, _, label in tracks})
+        embeddings = np.array([[1.0, 0.0] if label == "A" else [0.0, 1.0] for label in labels])
+        return FakeAnnotation(tracks), embeddings
+
+def run_chunked(speech, total_seconds, chunk_seconds=600, overlap_seconds=30):
+    pytest.importorskip("torch")
+    pipeline = FakePipeline(speech, chunk_seconds - overlap_seconds)
+    audio = np.zeros(int(total_seconds * SAMPLE_RATE), dtype=np.float32)
+    return list(diarize_chunked(pipeline, audio, SAMPLE_RATE, chunk_seconds, overlap_seconds))
+
+def test_turn_crossing_a_window_boundary_is_kept_whole():
+    turns = run_chunked([(580.0, 700.0, "A")], 1200)
+    assert turns == [(580.0, 700.0, "SPEAKER_00")]
+
+def test_turn_spanning_several_windows_is_kept_whole():
+    turns = run_chunked([(10.0, 20.0, "A"), (100.0, 1500.0, "B")], 1800)
+    assert turns == [(10.0, 20.0, "SPEAKER_00"), (100.0, 1500.0, "SPEAKER_01")]
+
+def test_turns_inside_one_window_are_unchanged():
+    turns = run_chunked([(10.0, 20.0, "A"), (30.0, 40.0, "B"), (700.0, 710.0, "A")], 1200)
+    assert turns == [(10.0, 20.0, "SPEAKER_00"), (30.0, 40.0, "SPEAKER_01"), (700.0, 710.0, "SPEAKER_00")]
+
+def test_coalesce_merges_same_speaker_gaps():
+    turns = [(0.0, 1.0, "A"), (1.2, 2.0, "A"), (3.0, 4.0, "A")]
+    assert list(coalesce_turns(turns)) == [(0.0, 2.0, "A"), (3.0, 4.0, "A")]
+
+def test_coalesce_absorbs_short_turn_into_preceding_turn():
+    turns = [(0.0, 1.0, "A"), (1.0, 1.1, "B"), (2.0, 3.0, "B")]
+    assert list(coalesce_turns(turns)) == [(0.0, 1.1, "A"), (2.0, 3.0, "B")]
+
+def test_coalesce_merges_turns_either_side_of_an_absorbed_short_turn():
+    turns = [(0.0, 1.0, "A"), (1.1, 1.2, "B"), (1.3, 2.0, "A")]
+    assert list(coalesce_turns(turns)) == [(0.0, 2.0, "A")]
+
+def test_coalesce_absorbs_leading_short_turns_into_the_next_turn():
+    turns = [(0.0, 0.1, "B"), (0.7, 0.8, "B"), (1.0, 2.0, "A")]
+    assert list(coalesce_turns(turns)) == [(0.0, 2.0, "A")]
+
+def test_coalesce_keeps_a_recording_of_only_short_turns():
+    assert list(coalesce_turns([(0.0, 0.1, "B")])) == [(0.0, 0.1, "B")]
+    assert list(coalesce_turns([(0.0, 0.1, "B"), (1.0, 1.1, "A")])) == [(0.0, 1.1, "B")]
+
+def test_coalesce_drops_short_turns_in_drop_mode():
+    turns = [(0.0, 1.0, "A"), (1.0, 1.1, "B"), (2.0, 3.0, "B")]
+    assert list(coalesce_turns(turns, short_turns="drop")) == [(0.0, 1.0, "A"), (2.0, 3.0, "B")]
+
+def test_coalesce_reports_turn_counts():
+    stats = {}
+    list(coalesce_turns([(0.0, 1.0, "A"), (1.1, 1.2, "B"), (1.3, 2.0, "A")], stats=stats))
+    assert stats == {'turns_in': 3, 'turns_out': 1}
@@ -0,0 +1,211 @@
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+import multiprocessing
+import numpy as np
+import whisper
+import torch
+from model_registry import get_whisper
+
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE  # 16 kHz
+N_SAMPLES = whisper.audio.N_SAMPLES  # Samples in one 30 s Whisper window
+
+# model.transcribe's defaults for re-decoding failed windows at higher temperatures and for skipping silent ones
+FALLBACK_TEMPERATURES = (0.2, 0.4, 0.6, 0.8, 1.0)
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+
+# Function to build a transcription record in the shape used by transcription.txt and sample.csv
+def make_record(start_time, end_time, speaker, text, language=None):
+    return {
+        'speaker': speaker,
+        'start_time': start_time,
+        'end_time': end_time,
+        'duration': end_time - start_time,
+        'text': text,
+        'language': language
+    }
+
+# Function to take a speaker turn out of the decoded audio buffer as a zero-copy view
+def slice_turn(audio, start_time, end_time):
+    return audio[int(start_time * SAMPLE_RATE):int(end_time * SAMPLE_RATE)]
+
+# Function to transcribe each turn with its own Whisper call
+def transcribe_sequential(model, audio, turns):
+    transcriptions = []
+    for start_time, end_time, speaker in turns:
+        result = model.transcribe(slice_turn(audio, start_time, end_time))
+        transcriptions.append(make_record(start_time, end_time, speaker, result['text'], result['language']))
+    return transcriptions
+
+# Function to split every turn into 30 s windows, remembering which turn each window belongs to
+def split_windows(audio, turns):
+    windows = []
+    for index, (start_time, end_time, _) in enumerate(turns):
+        segment = slice_turn(audio, start_time, end_time)
+        for offset in range(0, len(segment), N_SAMPLES):
+            windows.append((index, segment[offset:offset + N_SAMPLES]))
+    return windows
+
+# Function to check whether a decoded window failed model.transcribe's quality checks; silence is never retried
+def needs_fallback(result):
+    if result.no_speech_prob > NO_SPEECH_THRESHOLD:
+        return False
+    return result.compression_ratio > COMPRESSION_RATIO_THRESHOLD or result.avg_logprob < LOGPROB_THRESHOLD
+
+# Function to check whether a decoded window is silence that model.transcribe would have skipped
+def is_silent(result):
+    return result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob <= LOGPROB_THRESHOLD
+
+# Function to decode a batch of windows, re-decoding only the windows that fail the quality checks at each
+# higher fallback temperature in turn, as model.transcribe does for one window at a time
+def decode_with_fallback(model, mel, options):
+    results = list(whisper.decode(model, mel, options))
+    for temperature in FALLBACK_TEMPERATURES:
+        retry = [i for i, result in enumerate(results) if needs_fallback(result)]
+        if not retry:
+            break
+        for i, result in zip(retry, whisper.decode(model, mel[retry], replace(options, temperature=temperature))):
+            results[i] = result
+    return results
+
+# Function to transcribe turns in fixed-size batches of 30 s log-mel windows
+def transcribe_batched(model, audio, turns, batch_size=8):
+    windows = split_windows(audio, turns)
+    texts = [[] for _ in turns]
+    languages = [None] * len(turns)
+    options = whisper.DecodingOptions(without_timestamps=True, fp16=model.device.type == "cuda")
+
+    for batch_start in range(0, len(windows), batch_size):
+        batch = windows[batch_start:batch_start + batch_size]
+
+        # Pad short windows to 30 s and stack them into one (batch, n_mels, frames) tensor
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(segment), model.dims.n_mels)
+            for _, segment in batch
+        ]).to(model.device)
+
+        # Run the encoder and decoder once for the whole batch, then drop windows that decoded as silence
+        results = decode_with_fallback(model, mel, options)
+        for (index, _), result in zip(batch, results):
+            if not is_silent(result):
+                texts[index].append(result.text)
+            languages[index] = languages[index] or result.language
+
+    # Join window texts the same way model.transcribe joins its segments
+    return [
+        make_record(start_time, end_time, speaker, "".join(" " + text for text in texts[index] if text), languages[index])
+        for index, (start_time, end_time, speaker) in enumerate(turns)
+    ]
+
+# Function to transcribe turns as they arrive, decoding them batch_size turns at a time
+def transcribe_stream(model, audio, turns, batch_size=8):
+    batch = []
+    for turn in turns:
+        batch.append(turn)
+        if len(batch) == batch_size:
+            yield from transcribe_batched(model, audio, batch, batch_size)
+            batch = []
+    if batch:
+        yield from transcribe_batched(model, audio, batch, batch_size)
+
+# Model and audio buffer owned by each transcription worker process
+worker_state = {}
+
+# Function to load Whisper once per worker process and map the shared 16 kHz audio cache
+def init_worker(model_name, audio_cache_path, torch_threads):
+    torch.set_num_threads(torch_threads)
+    worker_state['model'] = get_whisper(model_name, device="cpu")
+    worker_state['audio'] = np.memmap(audio_cache_path, dtype=np.float32, mode='c')
+
+# Function run inside a worker to transcribe one shard of turns
+def transcribe_shard(shard_turns, batch_size):
+    return transcribe_batched(worker_state['model'], worker_state['audio'], shard_turns, batch_size)
+
+# Function to split time-ordered turns into contiguous shards of roughly equal cumulative duration
+def shard_turns(turns, n_shards):
+    total = sum(end_time - start_time for start_time, end_time, _ in turns)
+    shards = [[] for _ in range(n_shards)]
+    elapsed = 0.0
+    for index, (start_time, end_time, _) in enumerate(turns):
+        shard = min(int(elapsed / total * n_shards), n_shards - 1) if total > 0 else index % n_shards
+        shards[shard].append(index)
+        elapsed += end_time - start_time
+    return [shard for shard in shards if shard]
+
+# Function to fan batched transcription out over a pool of worker processes and merge the results in time order
+def transcribe_parallel(audio, turns, n_workers, torch_threads=1, model_name="base", batch_size=8, shards_per_worker=4):
+    # Several shards per worker lets the pool rebalance when some stretches of audio decode slower
+    shards = shard_turns(turns, n_workers * shards_per_worker)
+    transcriptions = [None] * len(turns)
+
+    # Spawned workers avoid inheriting the parent's torch thread pools; they re-map the audio cache by path
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(n_workers, mp_context=context, initializer=init_worker,
+                             initargs=(model_name, audio.filename, torch_threads)) as pool:
+        futures = [pool.submit(transcribe_shard, [turns[i] for i in shard], batch_size) for shard in shards]
+        for shard, future in zip(shards, futures):
+            for index, record in zip(shard, future.result()):
+                transcriptions[index] = record
+
+    return sorted(transcriptions, key=lambda t: t['start_time'])
+
+# Function to find the turn a word belongs to: the turn it overlaps most, or the nearest one if it overlaps none
+def assign_word(turns, starts, order, max_duration, word_start, word_end):
+    position = bisect_left(starts, word_end)
+    best_index, best_overlap = None, 0.0
+
+    # Only turns starting before the word ends and no earlier than the longest turn allows can overlap it
+    for j in range(position - 1, -1, -1):
+        if starts[j] < word_start - max_duration:
+            break
+        start_time, end_time, _ = turns[order[j]]
+        overlap = min(end_time, word_end) - max(start_time, word_start)
+        if overlap > best_overlap:
+            best_index, best_overlap = order[j], overlap
+    if best_index is not None:
+        return best_index
+
+    # Words in gaps between turns go to the closest neighbouring turn
+    midpoint = (word_start + word_end) / 2
+    candidates = [order[j] for j in (position - 1, position) if 0 <= j < len(order)]
+    return min(candidates, key=lambda i: min(abs(turns[i][0] - midpoint), abs(turns[i][1] - midpoint)))
+
+# Function to transcribe the whole file once with word timestamps and assign the words to speaker turns
+def transcribe_aligned(model, audio, turns):
+    if not turns:
+        return []
+
+    result = model.transcribe(audio, word_timestamps=True)
+    words = [word for segment in result['segments'] for word in segment.get('words', [])]
+
+    # Sort turns by start time for the overlap search
+    order = sorted(range(len(turns)), key=lambda i: turns[i][0])
+    starts = [turns[i][0] for i in order]
+    max_duration = max(end_time - start_time for start_time, end_time, _ in turns)
+
+    texts = [[] for _ in turns]
+    for word in words:
+        index = assign_word(turns, starts, order, max_duration, word['start'], word['end'])
+        texts[index].append(word['word'])
+
+    return [
+        make_record(start_time, end_time, speaker, "".join(texts[index]), result['language'])
+        for index, (start_time, end_time, speaker) in enumerate(turns)
+    ]
+
+# Function to detect the spoken language from the first 30 s mel window only
+def detect_language(model, audio):
+    mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio[:N_SAMPLES]), model.dims.n_mels).to(model.device)
+    _, probs = model.detect_language(mel)
+    return max(probs, key=probs.get)
+
+# Function to pick the language spoken for the longest total duration across transcribed segments
+def vote_language(transcriptions):
+    votes = Counter()
+    for t in transcriptions:
+        if t['language'] and t['text'].strip():
+            votes[t['language']] += t['duration']
+    return votes.most_common(1)[0][0] if votes else None
@@ -0,0 +1,96 @@
+import csv
+import os
+import re
+from collections import namedtuple
+
+# One speaker turn of a transcript; start and end are None for sample.csv rows, which carry no timestamps
+Segment = namedtuple('Segment', ['speaker', 'start', 'end', 'text'])
+
+# Precompiled pattern for the "Speaker SPEAKER_xx (a.aas - b.bbs): text" line that starts each turn
+TURN_PATTERN = re.compile(r"Speaker (\S+) \((\d+(?:\.\d+)?)s - (\d+(?:\.\d+)?)s\):(.*)")
+
+# Precompiled pattern for speaker labels and any standalone timestamps anywhere in a block of text
+LABEL_PATTERN = re.compile(r"Speaker \S+ \(\d+(?:\.\d+)?s - \d+(?:\.\d+)?s\):|\(\d+(?:\.\d+)?s - \d+(?:\.\d+)?s\)")
+
+# File types the transcript reader understands
+TRANSCRIPT_EXTENSIONS = ('.txt', '.csv')
+
+# Function to format a segment as a transcription.txt line
+def format_segment(segment):
+    return f"Speaker {segment.speaker} ({segment.start:.2f}s - {segment.end:.2f}s): {segment.text}"
+
+# Function to stream segments from transcription.txt lines, joining continuation lines to their turn
+def parse_transcript(lines):
+    match_turn = TURN_PATTERN.match
+    header, continuation = None, []
+    for line in lines:
+        # Cheap prefix test first so continuation lines never reach the regex engine
+        match = match_turn(line) if line.startswith("Speaker ") else None
+        if match:
+            if header is not None:
+                yield make_segment(header, continuation)
+            header, continuation = match, []
+        elif header is not None:
+            continuation.append(line.strip())
+    if header is not None:
+        yield make_segment(header, continuation)
+
+# Function to build a segment from a matched header line and its continuation lines
+def make_segment(header, continuation):
+    speaker, start, end, text = header.groups()
+    text = text.strip()
+    if continuation:
+        text = " ".join([text] + continuation).strip()
+    return Segment(speaker, float(start), float(end), text)
+
+# Function to remove speaker labels and timestamps from free text
+def strip_labels(text):
+    return LABEL_PATTERN.sub("", text).strip()
+
+# Function to stream segments from a transcription.txt file
+def read_text_transcript(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from parse_transcript(f)
+
+# Function to stream segments from a sample.csv file; a CSV without speaker and document columns has none
+def read_csv_transcript(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        if not {'speaker', 'document'} <= set(reader.fieldnames or ()):
+            return
+        for row in reader:
+            yield Segment(row['speaker'], None, None, (row['document'] or '').strip())
+
+# Function to stream segments from a transcript file of either format
+def read_transcript(path):
+    if path.endswith('.csv'):
+        return read_csv_transcript(path)
+    return read_text_transcript(path)
+
+# Function to check whether a file parses to at least one segment, reading only up to the first one
+def has_segments(path):
+    try:
+        return next(iter(read_transcript(path)), None) is not None
+    except UnicodeDecodeError:
+        return False
+
+# Function to expand files and directories into the transcript files they contain, skipping files such as
+# detected_language.txt that yield no segments
+def find_transcripts(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = [os.path.join(path, name) for name in sorted(os.listdir(path))
+                          if name.endswith(TRANSCRIPT_EXTENSIONS)]
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if has_segments(candidate):
+                yield candidate
+            else:
+                print(f"Skipping {candidate}: no transcript segments found")
+
+# Function to name an output file after the transcript it came from
+def output_path(output_dir, transcript_path, suffix):
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(transcript_path))[0]
+    return os.path.join(output_dir, f"{stem}_{suffix}")